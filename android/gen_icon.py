@@ -9,6 +9,7 @@ import struct
 import math
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw
 
 # === Descent 1 constants ===
@@ -38,10 +39,23 @@ POWERUP_TYPE_INFO_SIZE = 16
 POLYMODEL_HEADER_SIZE = 734
 JOINTPOS_SIZE = 8
 
+# Precompiled little-endian unpackers (avoid re-parsing the format per read)
+_S_U16 = struct.Struct('<H')
+_S_VEC = struct.Struct('<iii')
+
 
 class PigReader:
+    __slots__ = ('data', 'mv', 'pos')
+
+    _up_i32 = struct.Struct('<i').unpack_from
+    _up_u32 = struct.Struct('<I').unpack_from
+    _up_i16 = struct.Struct('<h').unpack_from
+    _up_u16 = _S_U16.unpack_from
+    _up_vec = _S_VEC.unpack_from
+
     def __init__(self, data, offset=0):
         self.data = data
+        self.mv = memoryview(data)
         self.pos = offset
 
     def tell(self):
@@ -55,23 +69,29 @@ class PigReader:
         self.pos += n
         return result
 
+    def read_memoryview(self, n):
+        """Like read_bytes, but returns a zero-copy view into the data."""
+        result = self.mv[self.pos:self.pos + n]
+        self.pos += n
+        return result
+
     def read_int32(self):
-        v = struct.unpack_from('<i', self.data, self.pos)[0]
+        v = self._up_i32(self.data, self.pos)[0]
         self.pos += 4
         return v
 
     def read_uint32(self):
-        v = struct.unpack_from('<I', self.data, self.pos)[0]
+        v = self._up_u32(self.data, self.pos)[0]
         self.pos += 4
         return v
 
     def read_int16(self):
-        v = struct.unpack_from('<h', self.data, self.pos)[0]
+        v = self._up_i16(self.data, self.pos)[0]
         self.pos += 2
         return v
 
     def read_uint16(self):
-        v = struct.unpack_from('<H', self.data, self.pos)[0]
+        v = self._up_u16(self.data, self.pos)[0]
         self.pos += 2
         return v
 
@@ -80,216 +100,218 @@ class PigReader:
         self.pos += 1
         return v
 
-    def read_fix(self):
-        return self.read_int32()
+    read_fix = read_int32
 
     def read_vector(self):
-        return (self.read_fix(), self.read_fix(), self.read_fix())
+        v = self._up_vec(self.data, self.pos)
+        self.pos += 12
+        return v
+
+    read_bitmap_index = read_uint16
 
-    def read_bitmap_index(self):
-        return self.read_uint16()
+
+# D1 robot_info, field for field; only the trailing magic is used
+_ROBOT_INFO_D1 = struct.Struct('<' + ''.join([
+    'ii',                            # model_num, n_guns
+    '%di' % (MAX_GUNS * 3),          # gun_points
+    '%dB' % MAX_GUNS,                # gun_submodels
+    '4h', 'h',                       # exp1/exp2 vclips and sounds, weapon_type
+    '4B', 'i',                       # contains_*, score_value
+    '4i',                            # lighting, strength, mass, drag
+    '%di' % (NDL * 3),               # field_of_view, firing_wait, turn_time
+    '%dx' % (4 * NDL * 2),           # fire_power, shield
+    '%di' % (NDL * 2),               # max_speed, circle_distance
+    '%dB' % (NDL * 2),               # rapidfire_count, evade_speed
+    '6B',                            # cloak, attack, boss, see/attack/claw sounds
+    '%dh' % ((MAX_GUNS + 1) * N_ANIM_STATES * 2),  # anim_states
+    'i',                             # always_0xabcd
+]))
 
 
 def read_robot_info_d1(r):
-    r.read_int32(); r.read_int32()  # model_num, n_guns
-    for _ in range(MAX_GUNS): r.read_vector()
-    for _ in range(MAX_GUNS): r.read_byte()
-    for _ in range(4): r.read_int16()
-    r.read_int16()
-    for _ in range(4): r.read_byte()
-    r.read_int32()
-    for _ in range(4): r.read_fix()
-    for _ in range(NDL * 3): r.read_fix()
-    r.skip(4 * NDL * 2)
-    for _ in range(NDL * 2): r.read_fix()
-    for _ in range(NDL * 2): r.read_byte()
-    for _ in range(6): r.read_byte()  # cloak, attack, boss, see/attack/claw sounds
-    for _ in range((MAX_GUNS + 1) * N_ANIM_STATES):
-        r.read_int16(); r.read_int16()
-    return r.read_int32()
+    magic = _ROBOT_INFO_D1.unpack_from(r.data, r.pos)[-1]
+    r.skip(_ROBOT_INFO_D1.size)
+    return magic
+
+
+_POLYMODEL_HEADER = struct.Struct('<' + ''.join([
+    'B3xI4x',                        # n_models, model_data_size, model_data
+    '%di' % MAX_SUBMODELS,           # submodel_ptrs
+    '%di' % (MAX_SUBMODELS * 3),     # submodel_offsets
+    '%dx' % (MAX_SUBMODELS * 12 * 2),  # submodel_norms, submodel_pnts
+    '%dx' % (MAX_SUBMODELS * 4),     # submodel_rads
+    '%dB' % MAX_SUBMODELS,           # submodel_parents
+    '%dx' % (MAX_SUBMODELS * 12 * 2),  # submodel_mins, submodel_maxs
+    '3i3ii',                         # mins, maxs, rad
+    'HBx',                           # first_texture, n_textures, simpler_model
+]))
+assert _POLYMODEL_HEADER.size == POLYMODEL_HEADER_SIZE
 
 
 def read_polymodel_header(r):
-    start = r.tell()
-    n_models = r.read_byte()
-    r.skip(3)
-    model_data_size = r.read_uint32()
-    r.skip(4)
-    submodel_ptrs = [r.read_int32() for _ in range(MAX_SUBMODELS)]
-    submodel_offsets = [r.read_vector() for _ in range(MAX_SUBMODELS)]
-    for _ in range(MAX_SUBMODELS): r.read_vector()
-    for _ in range(MAX_SUBMODELS): r.read_vector()
-    for _ in range(MAX_SUBMODELS): r.read_fix()
-    submodel_parents = [r.read_byte() for _ in range(MAX_SUBMODELS)]
-    for _ in range(MAX_SUBMODELS): r.read_vector()
-    for _ in range(MAX_SUBMODELS): r.read_vector()
-    mins = r.read_vector()
-    maxs = r.read_vector()
-    rad = r.read_fix()
-    first_texture = r.read_uint16()
-    n_textures = r.read_byte()
-    r.read_byte()
-    assert r.tell() - start == POLYMODEL_HEADER_SIZE
+    t = _POLYMODEL_HEADER.unpack_from(r.data, r.pos)
+    r.skip(POLYMODEL_HEADER_SIZE)
+    offsets = t[12:42]
     return {
-        'n_models': n_models,
-        'model_data_size': model_data_size,
-        'submodel_ptrs': submodel_ptrs,
-        'submodel_offsets': submodel_offsets,
-        'submodel_parents': submodel_parents,
-        'rad': rad, 'mins': mins, 'maxs': maxs,
-        'n_textures': n_textures, 'first_texture': first_texture,
+        'n_models': t[0],
+        'model_data_size': t[1],
+        'submodel_ptrs': list(t[2:12]),
+        'submodel_offsets': list(zip(offsets[0::3], offsets[1::3], offsets[2::3])),
+        'submodel_parents': list(t[42:52]),
+        'rad': t[58], 'mins': t[52:55], 'maxs': t[55:58],
+        'n_textures': t[60], 'first_texture': t[59],
     }
 
 
 def read_player_ship(r):
     model_num = r.read_int32()
-    r.read_int32()
-    for _ in range(7): r.read_fix()
-    for _ in range(8): r.read_vector()
+    r.skip(4 + 7 * 4 + 8 * 12)  # expl_vclip_num, physics fixes, gun_points
     return model_num
 
 
 def parse_pig_gamedata(pig_data):
     r = PigReader(pig_data, 4)
     r.read_int32()
-    for _ in range(MAX_TEXTURES): r.read_bitmap_index()
-    for _ in range(MAX_TEXTURES): r.skip(TMAP_INFO_SIZE)
+    r.skip(MAX_TEXTURES * 2)  # bitmap indices
+    r.skip(MAX_TEXTURES * TMAP_INFO_SIZE)
     r.skip(MAX_SOUNDS * 2)
     r.read_int32()
-    for _ in range(MAX_VCLIPS): r.skip(VCLIP_SIZE)
+    r.skip(MAX_VCLIPS * VCLIP_SIZE)
     r.read_int32()
-    for _ in range(MAX_EFFECTS): r.skip(ECLIP_SIZE)
+    r.skip(MAX_EFFECTS * ECLIP_SIZE)
     r.read_int32()
-    for _ in range(MAX_WALL_ANIMS): r.skip(D1_WCLIP_SIZE)
+    r.skip(MAX_WALL_ANIMS * D1_WCLIP_SIZE)
     n_robot_types = r.read_int32()
     for i in range(MAX_ROBOT_TYPES):
         magic = read_robot_info_d1(r)
         if i < n_robot_types:
             assert magic == 0x0000abcd, f"Robot {i} magic: 0x{magic:08x}"
     r.read_int32()
-    for _ in range(MAX_ROBOT_JOINTS): r.skip(JOINTPOS_SIZE)
+    r.skip(MAX_ROBOT_JOINTS * JOINTPOS_SIZE)
     r.read_int32()
-    for _ in range(MAX_WEAPON_TYPES): r.skip(WEAPON_INFO_D1_SIZE)
+    r.skip(MAX_WEAPON_TYPES * WEAPON_INFO_D1_SIZE)
     r.read_int32()
-    for _ in range(MAX_POWERUP_TYPES): r.skip(POWERUP_TYPE_INFO_SIZE)
+    r.skip(MAX_POWERUP_TYPES * POWERUP_TYPE_INFO_SIZE)
     n_polygon_models = r.read_int32()
     print(f"N_polygon_models: {n_polygon_models}")
     polymodels = []
     for i in range(n_polygon_models):
         polymodels.append(read_polymodel_header(r))
     for i in range(n_polygon_models):
-        polymodels[i]['model_data'] = r.read_bytes(polymodels[i]['model_data_size'])
-    for _ in range(MAX_GAUGE_BMS): r.read_bitmap_index()
-    for _ in range(MAX_POLYGON_MODELS * 2): r.read_int32()
-    for _ in range(MAX_OBJ_BITMAPS): r.read_bitmap_index()
-    for _ in range(MAX_OBJ_BITMAPS): r.read_int16()
+        polymodels[i]['model_data'] = r.read_memoryview(polymodels[i]['model_data_size'])
+    r.skip(MAX_GAUGE_BMS * 2)  # gauge bitmap indices
+    r.skip(MAX_POLYGON_MODELS * 8)  # dying/dead model nums
+    r.skip(MAX_OBJ_BITMAPS * 2)  # object bitmap indices
+    r.skip(MAX_OBJ_BITMAPS * 2)  # object bitmap pointers
     player_model_num = read_player_ship(r)
     print(f"Player ship model_num: {player_model_num}")
     return polymodels, player_model_num
 
 
-def render_polymodel_bsp(model_data, submodel_ptrs, n_models,
-                         angle_x, angle_y, angle_z, size):
-    """Render polymodel with BSP-ordered traversal, back-face culling, and lighting.
+def _unpack_points(data, off, n):
+    """Unpack n consecutive fix vectors at `off` as raw (x, y, z) tuples."""
+    c = struct.unpack_from('<%di' % (n * 3), data, off)
+    return list(zip(c[0::3], c[1::3], c[2::3]))
 
-    The polymodel interpreter data is a BSP tree. SORTNORM nodes split space by a
-    plane; we evaluate which side the viewer is on and traverse back-to-front.
-    FLATPOLY/TMAPPOLY leaves are back-face culled using their stored normal.
-    """
-    cx, sx = math.cos(angle_x), math.sin(angle_x)
-    cy, sy = math.cos(angle_y), math.sin(angle_y)
-    cz, sz = math.cos(angle_z), math.sin(angle_z)
 
-    # View direction in model space: R^T * (0, 0, 1)
-    view_dir = (-sy * cx, sx, cy * cx)
-
-    def rotate(x, y, z):
-        x1 = x * cy + z * sy
-        z1 = -x * sy + z * cy
-        y1 = y * cx - z1 * sx
-        z2 = y * sx + z1 * cx
-        x2 = x1 * cz - y1 * sz
-        y2 = x1 * sz + y1 * cz
-        return (x2, y2, z2)
-
-    def read_u16(off):
-        return struct.unpack_from('<H', model_data, off)[0]
-
-    def read_vec(off):
-        x, y, z = struct.unpack_from('<iii', model_data, off)
-        return (x / 65536.0, y / 65536.0, z / 65536.0)
-
-    def dot3(a, b):
-        return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+def _traverse_bsp(model_data, root, view_dir, include_submodels=None):
+    """Walk the polymodel BSP tree starting at offset `root`.
 
+    Returns (pool, polys): every model-space point the tree defines, as raw
+    16.16 fix tuples, and the polygons facing `view_dir` in back-to-front
+    order as (pool indices, light) pairs. Rotation and conversion to model
+    units are left to the caller so each point is handled only once.
+    SUBCALLs into submodels not in `include_submodels` are skipped (None
+    follows them all).
+    """
+    md = model_data
+    md_end = len(model_data) - 1
+    u16 = _S_U16.unpack_from
+    vec = _S_VEC.unpack_from
+    vdx, vdy, vdz = view_dir
+
+    # `points` maps the current point numbers onto pool indices
+    pool = []
     points = []
-    draw_list = []
+    polys = []
+    polys_append = polys.append
 
-    def traverse(p):
-        """Walk the BSP tree, collecting visible polygons in back-to-front order."""
-        while p < len(model_data) - 1:
-            op = read_u16(p)
+    # Each stack entry is an offset to resume at once the current op stream
+    # hits EOF; SORTNORM and SUBCALL push their continuation (and SORTNORM
+    # its near half) and carry on inline.
+    stack = [root]
+
+    while stack:
+        p = stack.pop()
+        while p < md_end:
+            op = u16(md, p)[0]
 
             if op == 0:  # EOF
                 break
 
             elif op == 1:  # DEFPOINTS
-                n = read_u16(p + 2)
-                points.clear()
-                for i in range(n):
-                    points.append(read_vec(p + 4 + i * 12))
+                n = u16(md, p + 2)[0]
+                points = list(range(len(pool), len(pool) + n))
+                pool.extend(_unpack_points(md, p + 4, n))
                 p += 4 + n * 12
 
             elif op == 7:  # DEFP_START
-                n = read_u16(p + 2)
-                start = read_u16(p + 4)
-                for i in range(n):
-                    v = read_vec(p + 8 + i * 12)
-                    while len(points) <= start + i:
-                        points.append((0, 0, 0))
-                    points[start + i] = v
+                n = u16(md, p + 2)[0]
+                start = u16(md, p + 4)[0]
+                while len(points) < start:
+                    points.append(len(pool))
+                    pool.append((0, 0, 0))
+                points[start:start + n] = range(len(pool), len(pool) + n)
+                pool.extend(_unpack_points(md, p + 8, n))
                 p += 8 + n * 12
 
             elif op == 2 or op == 3:  # FLATPOLY or TMAPPOLY
-                n = read_u16(p + 2)
-                normal = read_vec(p + 16)
-                facing = dot3(view_dir, normal)
-
-                verts = []
-                for i in range(n):
-                    idx = read_u16(p + 30 + i * 2)
-                    if idx < len(points):
-                        verts.append(points[idx])
-                if len(verts) >= 3 and facing > 0:
-                    proj = [rotate(*v) for v in verts]
-                    light = 0.75 + 0.25 * facing
-                    draw_list.append((proj, light))
+                n = u16(md, p + 2)[0]
+                nx, ny, nz = vec(md, p + 16)
+                facing = vdx * nx + vdy * ny + vdz * nz
+                poly = p
 
                 if op == 2:  # FLATPOLY
                     p += 30 + ((n & ~1) + 1) * 2
                 else:  # TMAPPOLY
                     p += 30 + ((n & ~1) + 1) * 2 + n * 12
 
-            elif op == 4:  # SORTNORM
-                plane_normal = read_vec(p + 4)
-                front_off = read_u16(p + 28)
-                back_off = read_u16(p + 30)
+                # Back-face cull before touching the vertex list at all; only
+                # the sign matters, so the fix normal is used unscaled
+                if facing <= 0:
+                    continue
+
+                verts = []
+                n_points = len(points)
+                for i in range(n):
+                    idx = u16(md, poly + 30 + i * 2)[0]
+                    if idx < n_points:
+                        verts.append(points[idx])
+                if len(verts) >= 3:
+                    polys_append((verts, 0.75 + 0.25 * (facing / 65536.0)))
 
-                if dot3(view_dir, plane_normal) > 0:
-                    traverse(p + back_off)
-                    traverse(p + front_off)
+            elif op == 4:  # SORTNORM
+                nx, ny, nz = vec(md, p + 4)
+                front_off = u16(md, p + 28)[0]
+                back_off = u16(md, p + 30)[0]
+
+                stack.append(p + 32)
+                if vdx * nx + vdy * ny + vdz * nz > 0:
+                    stack.append(p + front_off)
+                    p += back_off
                 else:
-                    traverse(p + front_off)
-                    traverse(p + back_off)
-                p += 32
+                    stack.append(p + back_off)
+                    p += front_off
 
             elif op == 5:  # RODBM
                 p += 36
 
             elif op == 6:  # SUBCALL
-                sub_off = read_u16(p + 16)
-                traverse(p + sub_off)
-                p += 20
+                if include_submodels is None or u16(md, p + 2)[0] in include_submodels:
+                    stack.append(p + 20)
+                    p += u16(md, p + 16)[0]
+                else:
+                    p += 20
 
             elif op == 8:  # GLOW
                 p += 4
@@ -297,49 +319,117 @@ def render_polymodel_bsp(model_data, submodel_ptrs, n_models,
             else:
                 break
 
+    return pool, polys
+
+
+def collect_polys(model_data, submodel_ptrs, n_models,
+                  angle_x, angle_y, angle_z, include_submodels=None):
+    """Collect the visible polygons of a polymodel, rotated into view space.
+
+    The polymodel interpreter data is a BSP tree. SORTNORM nodes split space by a
+    plane; we evaluate which side the viewer is on and traverse back-to-front.
+    FLATPOLY/TMAPPOLY leaves are back-face culled using their stored normal.
+
+    include_submodels restricts which submodels SUBCALLs descend into; (0,)
+    renders the main hull only, skipping guns and other attachments. The
+    default (None) renders every submodel.
+
+    Returns (draw_list, bbox): (rotated points, light) pairs in back-to-front
+    order, and the (min_x, min_y, max_x, max_y) of all points, or None if
+    nothing is visible. Nothing here depends on the output resolution.
+    """
+    cx, sx = math.cos(angle_x), math.sin(angle_x)
+    cy, sy = math.cos(angle_y), math.sin(angle_y)
+    cz, sz = math.cos(angle_z), math.sin(angle_z)
+
+    # Rotation about Y, then X, then Z, composed into one matrix R
+    r00 = cy * cz - sx * sy * sz
+    r01 = -cx * sz
+    r02 = sy * cz + sx * cy * sz
+    r10 = cy * sz + sx * sy * cz
+    r11 = cx * cz
+    r12 = sy * sz - sx * cy * cz
+    r20 = -cx * sy
+    r21 = sx
+    r22 = cx * cy
+
+    # View direction in model space: R^T * (0, 0, 1)
+    view_dir = (r20, r21, r22)
+
+    # Pool points are raw 16.16 fix values; scaling them to model units is
+    # folded into the matrix, so each coordinate is converted exactly once
+    m00, m01, m02 = r00 / 65536.0, r01 / 65536.0, r02 / 65536.0
+    m10, m11, m12 = r10 / 65536.0, r11 / 65536.0, r12 / 65536.0
+    m20, m21, m22 = r20 / 65536.0, r21 / 65536.0, r22 / 65536.0
+
+    def rotate(x, y, z):
+        return (m00 * x + m01 * y + m02 * z,
+                m10 * x + m11 * y + m12 * z,
+                m20 * x + m21 * y + m22 * z)
+
     if n_models > 0 and submodel_ptrs[0] < len(model_data):
-        traverse(submodel_ptrs[0])
+        pool, polys = _traverse_bsp(model_data, submodel_ptrs[0], view_dir,
+                                    include_submodels)
+    else:
+        pool, polys = [], []
+
+    rotated = [rotate(*v) for v in pool]
+    draw_list = [([rotated[i] for i in verts], light) for verts, light in polys]
 
     if not draw_list:
-        return Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        return draw_list, None
+
+    # Bounding box over each drawn point once, as plain coordinate columns
+    xs, ys, _ = zip(*[rotated[i] for i in {i for verts, _ in polys for i in verts}])
+    return draw_list, (min(xs), min(ys), max(xs), max(ys))
+
 
-    all_pts = [pt for proj, _ in draw_list for pt in proj]
-    min_x = min(pt[0] for pt in all_pts)
-    max_x = max(pt[0] for pt in all_pts)
-    min_y = min(pt[1] for pt in all_pts)
-    max_y = max(pt[1] for pt in all_pts)
+def rasterize(draw_list, bbox, size):
+    """Draw a collect_polys() result in grey on black, fitted to size x size.
 
+    The ship is the only thing on the image, so it is drawn in mode 'L'
+    rather than carrying an alpha channel around; black is background.
+    """
+    if not draw_list:
+        return Image.new('L', (size, size), 0)
+
+    min_x, min_y, max_x, max_y = bbox
     range_x = max_x - min_x or 1
     range_y = max_y - min_y or 1
     margin = size * 0.08
     usable = size - 2 * margin
     scale = min(usable / range_x, usable / range_y)
     off_x = size / 2 - (min_x + max_x) / 2 * scale
-    off_y = size / 2 - (min_y + max_y) / 2 * scale
+    off_y = size / 2 + (min_y + max_y) / 2 * scale
 
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    img = Image.new('L', (size, size), 0)
+    draw_polygon = ImageDraw.Draw(img).polygon
 
+    # Polygons must stay in BSP order, so they are drawn one at a time.
+    # Screen y runs downwards, so y is negated here rather than flipping
+    # the finished image.
     for proj, light in draw_list:
-        screen_pts = [(pt[0] * scale + off_x, pt[1] * scale + off_y) for pt in proj]
-        v = max(0, min(255, int(255 * light)))
-        draw.polygon(screen_pts, fill=(v, v, v, 255))
+        screen_pts = [(x * scale + off_x, off_y - y * scale) for x, y, _ in proj]
+        draw_polygon(screen_pts, fill=max(0, min(255, int(255 * light))))
 
-    img = img.transpose(Image.FLIP_TOP_BOTTOM)
     return img
 
 
-def make_ship_icon(ship_render, size, output_path):
-    """Compose white ship silhouette on plain black background."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 255))
+def render_polymodel_bsp(model_data, submodel_ptrs, n_models,
+                         angle_x, angle_y, angle_z, size,
+                         include_submodels=None):
+    """Render polymodel with BSP-ordered traversal, back-face culling, and lighting."""
+    draw_list, bbox = collect_polys(model_data, submodel_ptrs, n_models,
+                                    angle_x, angle_y, angle_z, include_submodels)
+    return rasterize(draw_list, bbox, size)
+
 
-    ship_size = int(size * 0.84)
-    ship_resized = ship_render.resize((ship_size, ship_size), Image.LANCZOS)
-    offset = (size - ship_size) // 2
+def make_ship_icon(ship_resized, size, output_path):
+    """Compose pre-resized white ship silhouette on plain black background."""
+    img = Image.new('RGB', (size, size), (0, 0, 0))
 
-    ship_layer = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    ship_layer.paste(ship_resized, (offset, offset), ship_resized)
-    img = Image.alpha_composite(img, ship_layer)
+    offset = (size - ship_resized.width) // 2
+    img.paste(ship_resized, (offset, offset))
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     img.save(output_path, 'PNG')
@@ -379,38 +469,35 @@ def draw_roman_two(draw, size):
 
 
 def _draw_serif_I(draw, cx, top_y, w, h, serif, serif_h, expand, color):
-    """Draw a single serifed 'I' character centered at cx."""
+    """Draw a single serifed 'I' character centered at cx.
+
+    The stroke and both serifs are one polygon, so a translucent color is
+    blended exactly once even when drawing straight onto the icon.
+    """
     e = expand  # outline expansion
     half_w = w // 2
 
-    # Vertical stroke
-    draw.rectangle([cx - half_w - e, top_y - e,
-                     cx + half_w + e, top_y + h + e], fill=color)
-    # Top serif
-    draw.rectangle([cx - half_w - serif - e, top_y - e,
-                     cx + half_w + serif + e, top_y + serif_h + e], fill=color)
-    # Bottom serif
-    draw.rectangle([cx - half_w - serif - e, top_y + h - serif_h - e,
-                     cx + half_w + serif + e, top_y + h + e], fill=color)
+    # Stroke edges, serif edges, and where the serifs meet the stroke
+    sl, sr = cx - half_w - e, cx + half_w + e
+    fl, fr = cx - half_w - serif - e, cx + half_w + serif + e
+    top, bottom = top_y - e, top_y + h + e
+    top_in, bottom_in = top_y + serif_h + e, top_y + h - serif_h - e
 
+    draw.polygon([(fl, top), (fr, top), (fr, top_in), (sr, top_in),
+                  (sr, bottom_in), (fr, bottom_in), (fr, bottom), (fl, bottom),
+                  (fl, bottom_in), (sl, bottom_in), (sl, top_in), (fl, top_in)],
+                 fill=color)
 
-def make_d2_icon(ship_render, size, output_path):
-    """Compose ship icon with "II" overlay for Descent II."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 255))
 
-    ship_size = int(size * 0.84)
-    ship_resized = ship_render.resize((ship_size, ship_size), Image.LANCZOS)
-    offset = (size - ship_size) // 2
+def make_d2_icon(ship_resized, size, output_path):
+    """Compose pre-resized ship icon with "II" overlay for Descent II."""
+    img = Image.new('RGB', (size, size), (0, 0, 0))
 
-    ship_layer = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    ship_layer.paste(ship_resized, (offset, offset), ship_resized)
-    img = Image.alpha_composite(img, ship_layer)
+    offset = (size - ship_resized.width) // 2
+    img.paste(ship_resized, (offset, offset))
 
-    # Draw "II" overlay
-    overlay = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-    draw_roman_two(overlay_draw, size)
-    img = Image.alpha_composite(img, overlay)
+    # Draw "II" overlay, blending straight onto the icon
+    draw_roman_two(ImageDraw.Draw(img, 'RGBA'), size)
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     img.save(output_path, 'PNG')
@@ -441,16 +528,30 @@ def main():
     angle_y = 0.5
     angle_z = 0.0
 
-    ship_img = render_polymodel_bsp(
+    draw_list, bbox = collect_polys(
         pm['model_data'], pm['submodel_ptrs'], pm['n_models'],
-        angle_x, angle_y, angle_z, render_size
+        angle_x, angle_y, angle_z
     )
+    # Rasterize once at full size; ImageDraw polygons are not antialiased,
+    # so the smaller icons get their smooth edges from the LANCZOS downscale
+    ship_img = rasterize(draw_list, bbox, render_size)
 
     # Determine output base
     base = '/build/dxx-android/app/src/main/res'
     if not os.path.exists('/build/dxx-android'):
         base = os.path.expanduser('~/descent/dxx-android/app/src/main/res')
 
+    # Ship occupies this fraction of each icon; each distinct ship size is
+    # LANCZOS-resized from the render only once
+    ship_scale = 0.84
+    resized_ships = {}
+
+    def resized_ship(icon_size):
+        ship_size = int(icon_size * ship_scale)
+        if ship_size not in resized_ships:
+            resized_ships[ship_size] = ship_img.resize((ship_size, ship_size), Image.LANCZOS)
+        return resized_ships[ship_size]
+
     densities = {
         'mipmap-mdpi': 48,
         'mipmap-hdpi': 72,
@@ -462,32 +563,35 @@ def main():
     if args.d2:
         # Save preview
         preview_path = args.preview or '/tmp/ship_icon_d2_preview.png'
-        preview = Image.new('RGBA', (512, 512), (0, 0, 0, 255))
-        preview = Image.alpha_composite(preview, ship_img)
-        overlay = Image.new('RGBA', (512, 512), (0, 0, 0, 0))
-        draw_roman_two(ImageDraw.Draw(overlay), 512)
-        preview = Image.alpha_composite(preview, overlay)
+        preview = ship_img.convert('RGB')
+        draw_roman_two(ImageDraw.Draw(preview, 'RGBA'), 512)
         preview.save(preview_path)
         print(f"D2 icon preview: {preview_path}")
 
         print("\nGenerating Descent II app icons...")
-        for folder, icon_size in densities.items():
-            path = f"{base}/{folder}/ic_launcher_d2.png"
-            make_d2_icon(ship_img, icon_size, path)
-        make_d2_icon(ship_img, 512, f"{base}/../ic_launcher_d2_512.png")
+        make_icon = make_d2_icon
+        icons = {f"{base}/{folder}/ic_launcher_d2.png": icon_size
+                 for folder, icon_size in densities.items()}
+        icons[f"{base}/../ic_launcher_d2_512.png"] = 512
     else:
         # Save preview
         preview_path = args.preview or '/tmp/ship_icon_preview.png'
-        preview = Image.new('RGBA', (512, 512), (0, 0, 0, 255))
-        preview = Image.alpha_composite(preview, ship_img)
+        preview = ship_img.convert('RGB')
         preview.save(preview_path)
         print(f"Icon preview: {preview_path}")
 
         print("\nGenerating app icons...")
-        for folder, icon_size in densities.items():
-            path = f"{base}/{folder}/ic_launcher.png"
-            make_ship_icon(ship_img, icon_size, path)
-        make_ship_icon(ship_img, 512, f"{base}/../ic_launcher_512.png")
+        make_icon = make_ship_icon
+        icons = {f"{base}/{folder}/ic_launcher.png": icon_size
+                 for folder, icon_size in densities.items()}
+        icons[f"{base}/../ic_launcher_512.png"] = 512
+
+    # PIL releases the GIL while deflating PNGs, so write the icons in parallel
+    with ThreadPoolExecutor(max_workers=len(icons)) as executor:
+        futures = [executor.submit(make_icon, resized_ship(icon_size), icon_size, path)
+                   for path, icon_size in icons.items()]
+    for future in futures:
+        future.result()
 
     print("Done!")
 